@@ -9,10 +9,12 @@
     AnalysisReportEvent,
     AnalysisStatusEvent,
     AnalysisTimeEvent,
+    AnalysisTimingEvent,
 )
 from .snapshots import (
     ObservationAndResponseSnapshot,
     ObservationStatus,
+    PhaseTiming,
     SmootherSnapshot,
 )
 
@@ -22,9 +24,11 @@
     "AnalysisReportEvent",
     "AnalysisStatusEvent",
     "AnalysisTimeEvent",
+    "AnalysisTimingEvent",
     "ErtAnalysisError",
     "ObservationAndResponseSnapshot",
     "ObservationStatus",
+    "PhaseTiming",
     "SmootherSnapshot",
     "iterative_smoother_update",
     "smoother_update",
@@ -31,6 +31,7 @@
 from ..config.analysis_config import ObservationGroups, UpdateSettings
 from ..config.analysis_module import ESSettings, IESSettings
 from . import misfit_preprocessor
+from ._phase_timer import phase_timer
 from .event import (
     AnalysisCompleteEvent,
     AnalysisDataEvent,
@@ -38,10 +39,12 @@
     AnalysisEvent,
     AnalysisStatusEvent,
     AnalysisTimeEvent,
+    AnalysisTimingEvent,
     DataSection,
 )
 from .snapshots import (
     ObservationAndResponseSnapshot,
+    PhaseTiming,
     SmootherSnapshot,
 )
 
@@ -139,6 +142,7 @@ def _get_observations_and_responses(
     ensemble: Ensemble,
     selected_observations: Iterable[str],
     iens_active_index: npt.NDArray[np.int_],
+    dtype: npt.DTypeLike = np.float64,
 ) -> Tuple[
     npt.NDArray[np.float64],
     npt.NDArray[np.float64],
@@ -204,7 +208,7 @@ def _get_observations_and_responses(
         )
     ensemble.load_responses.cache_clear()
     return (
-        np.concatenate(filtered_responses),
+        np.concatenate(filtered_responses, dtype=dtype),
         np.concatenate(observation_values),
         np.concatenate(observation_errors),
         np.concatenate(observation_keys),
@@ -234,6 +238,33 @@ def _expand_wildcards(
     return sorted(set(matches))
 
 
+def _compress_rows_in_place(
+    arr: npt.NDArray[np.float64], mask: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.float64]:
+    """
+    Moves the rows of arr where mask is True to the start of arr and returns
+    a view of them. This gives the same result as arr[mask] without allocating
+    a copy of the selected rows.
+
+    Examples
+    --------
+    >>> arr = np.arange(10).reshape(5, 2)
+    >>> _compress_rows_in_place(arr, np.array([False, True, True, False, True]))
+    array([[2, 3],
+           [4, 5],
+           [8, 9]])
+    """
+    if mask.all():
+        return arr
+    edges = np.flatnonzero(np.diff(mask, prepend=False, append=False))
+    nr_rows = 0
+    for start, stop in zip(edges[::2], edges[1::2]):
+        if start != nr_rows:
+            arr[nr_rows : nr_rows + stop - start] = arr[start:stop]
+        nr_rows += stop - start
+    return arr[:nr_rows]
+
+
 def _load_observations_and_responses(
     ensemble: Ensemble,
     alpha: float,
@@ -243,6 +274,7 @@ def _load_observations_and_responses(
     selected_observations: Iterable[str],
     auto_scale_observations: Optional[List[ObservationGroups]],
     progress_callback: Callable[[AnalysisEvent], None],
+    dtype: npt.DTypeLike = np.float64,
 ) -> Tuple[
     npt.NDArray[np.float64],
     Tuple[
@@ -251,11 +283,13 @@ def _load_observations_and_responses(
         List[ObservationAndResponseSnapshot],
     ],
 ]:
-    S, observations, errors, obs_keys, indexes = _get_observations_and_responses(
-        ensemble,
-        selected_observations,
-        iens_active_index,
-    )
+    with phase_timer("load_observations_and_responses", progress_callback):
+        S, observations, errors, obs_keys, indexes = _get_observations_and_responses(
+            ensemble,
+            selected_observations,
+            iens_active_index,
+            dtype,
+        )
 
     # Inflating measurement errors by a factor sqrt(global_std_scaling) as shown
     # in for example evensen2018 - Analysis of iterative ensemble smoothers for
@@ -279,9 +313,12 @@ def _load_observations_and_responses(
             if not any(obs_group_mask):
                 logger.error(f"No observations active for group: {input_group}")
                 continue
-            scaling_factors, clusters, nr_components = misfit_preprocessor.main(
-                S[obs_group_mask], scaled_errors[obs_group_mask]
-            )
+            with phase_timer(
+                "auto_scale: " + ", ".join(input_group), progress_callback
+            ):
+                scaling_factors, clusters, nr_components = misfit_preprocessor.main(
+                    S[obs_group_mask], scaled_errors[obs_group_mask]
+                )
             scaling[obs_group_mask] *= scaling_factors
             progress_callback(
                 AnalysisDataEvent(
@@ -346,7 +383,7 @@ def _load_observations_and_responses(
     for missing_obs in obs_keys[~obs_mask]:
         logger.warning(f"Deactivating observation: {missing_obs}")
 
-    return S[obs_mask], (
+    return _compress_rows_in_place(S, obs_mask), (
         observations[obs_mask],
         scaled_errors[obs_mask],
         update_snapshot,
@@ -425,6 +462,25 @@ def _calculate_adaptive_batch_size(num_params: int, num_obs: int) -> int:
     )
 
 
+def _apply_transition_in_place(
+    X: npt.NDArray[np.float64],
+    T: npt.NDArray[np.float64],
+    chunk_size: int = 10_000,
+) -> None:
+    """
+    Computes X @ T and stores the result in X. The product is computed for
+    chunk_size rows of X at the time into a preallocated buffer, so that the
+    extra memory needed is independent of the number of parameters.
+    """
+    T = T.astype(X.dtype, copy=False)
+    buffer = np.empty((min(chunk_size, X.shape[0]), T.shape[1]), dtype=X.dtype)
+    for start in range(0, X.shape[0], chunk_size):
+        stop = min(start + chunk_size, X.shape[0])
+        out = buffer[: stop - start]
+        np.matmul(X[start:stop], T, out=out)
+        X[start:stop] = out
+
+
 def _copy_unupdated_parameters(
     all_parameter_groups: Iterable[str],
     updated_parameter_groups: Iterable[str],
@@ -480,6 +536,7 @@ def analysis_ES(
     iens_active_index = np.flatnonzero(ens_mask)
 
     ensemble_size = ens_mask.sum()
+    dtype = np.float32 if module.float32 else np.float64
 
     def adaptive_localization_progress_callback(
         iterable: Sequence[T],
@@ -503,6 +560,7 @@ def adaptive_localization_progress_callback(
         observations,
         auto_scale_observations,
         progress_callback,
+        dtype,
     )
     num_obs = len(observation_values)
 
@@ -532,25 +590,30 @@ def adaptive_localization_progress_callback(
     truncation = module.enkf_truncation
 
     if module.localization:
-        smoother_adaptive_es = AdaptiveESMDA(
-            covariance=observation_errors**2,
-            observations=observation_values,
-            seed=rng,
-        )
+        with phase_timer("localization_setup", progress_callback):
+            smoother_adaptive_es = AdaptiveESMDA(
+                covariance=observation_errors**2,
+                observations=observation_values,
+                seed=rng,
+            )
 
-        # Pre-calculate cov_YY
-        cov_YY = np.atleast_2d(np.cov(S))
+            # Pre-calculate cov_YY
+            cov_YY = np.atleast_2d(np.cov(S, dtype=dtype))
 
-        D = smoother_adaptive_es.perturb_observations(
-            ensemble_size=ensemble_size, alpha=1.0
-        )
+            D = smoother_adaptive_es.perturb_observations(
+                ensemble_size=ensemble_size, alpha=1.0
+            ).astype(dtype, copy=False)
 
     else:
-        # Compute transition matrix so that
-        # X_posterior = X_prior @ T
-        T = smoother_es.compute_transition_matrix(Y=S, alpha=1.0, truncation=truncation)
-        # Add identity in place for fast computation
-        np.fill_diagonal(T, T.diagonal() + 1)
+        with phase_timer("transition_matrix", progress_callback):
+            # Compute transition matrix so that
+            # X_posterior = X_prior @ T
+            T = smoother_es.compute_transition_matrix(
+                Y=S, alpha=1.0, truncation=truncation
+            )
+            # Add identity in place for fast computation
+            np.fill_diagonal(T, T.diagonal() + 1)
+            T = T.astype(dtype, copy=False)
 
     def correlation_callback(
         cross_correlations_of_batch: npt.NDArray[np.float64],
@@ -559,9 +622,10 @@ def correlation_callback(
         cross_correlations_accumulator.append(cross_correlations_of_batch)
 
     for param_group in parameters:
-        param_ensemble_array = _load_param_ensemble_array(
-            source_ensemble, param_group, iens_active_index
-        )
+        with phase_timer(f"load_parameters: {param_group}", progress_callback):
+            param_ensemble_array = _load_param_ensemble_array(
+                source_ensemble, param_group, iens_active_index
+            )
         if module.localization:
             config_node = source_ensemble.experiment.parameter_configuration[
                 param_group
@@ -574,29 +638,29 @@ def correlation_callback(
             logger.info(log_msg)
             progress_callback(AnalysisStatusEvent(msg=log_msg))
 
-            start = time.time()
             cross_correlations: List[npt.NDArray[np.float64]] = []
-            for param_batch_idx in batches:
-                X_local = param_ensemble_array[param_batch_idx, :]
-                if isinstance(config_node, GenKwConfig):
-                    correlation_batch_callback = functools.partial(
-                        correlation_callback,
-                        cross_correlations_accumulator=cross_correlations,
-                    )
-                else:
-                    correlation_batch_callback = None
-                param_ensemble_array[param_batch_idx, :] = (
-                    smoother_adaptive_es.assimilate(
-                        X=X_local,
-                        Y=S,
-                        D=D,
-                        alpha=1.0,  # The user is responsible for scaling observation covariance (esmda usage)
-                        correlation_threshold=module.correlation_threshold,
-                        cov_YY=cov_YY,
-                        progress_callback=adaptive_localization_progress_callback,
-                        correlation_callback=correlation_batch_callback,
+            with phase_timer(f"localization: {param_group}", progress_callback):
+                for param_batch_idx in batches:
+                    X_local = param_ensemble_array[param_batch_idx, :]
+                    if isinstance(config_node, GenKwConfig):
+                        correlation_batch_callback = functools.partial(
+                            correlation_callback,
+                            cross_correlations_accumulator=cross_correlations,
+                        )
+                    else:
+                        correlation_batch_callback = None
+                    param_ensemble_array[param_batch_idx, :] = (
+                        smoother_adaptive_es.assimilate(
+                            X=X_local,
+                            Y=S,
+                            D=D,
+                            alpha=1.0,  # The user is responsible for scaling observation covariance (esmda usage)
+                            correlation_threshold=module.correlation_threshold,
+                            cov_YY=cov_YY,
+                            progress_callback=adaptive_localization_progress_callback,
+                            correlation_callback=correlation_batch_callback,
+                        )
                     )
-                )
 
             if cross_correlations:
                 assert isinstance(config_node, GenKwConfig)
@@ -611,28 +675,21 @@ def correlation_callback(
                         param_group,
                         parameter_names[: _cross_correlations.shape[0]],
                     )
-            logger.info(
-                f"Adaptive Localization of {param_group} completed in {(time.time() - start) / 60} minutes"
-            )
 
         else:
-            # In-place multiplication is not yet supported, therefore avoiding @=
-            param_ensemble_array = param_ensemble_array @ T.astype(  # noqa: PLR6104
-                param_ensemble_array.dtype
-            )
+            with phase_timer(f"matmul: {param_group}", progress_callback):
+                _apply_transition_in_place(param_ensemble_array, T)
 
         log_msg = f"Storing data for {param_group}.."
         logger.info(log_msg)
         progress_callback(AnalysisStatusEvent(msg=log_msg))
-        start = time.time()
 
-        _save_param_ensemble_array_to_disk(
-            target_ensemble, param_ensemble_array, param_group, iens_active_index
-        )
-        logger.info(
-            f"Storing data for {param_group} completed in {(time.time() - start) / 60} minutes"
-        )
+        with phase_timer(f"store_parameters: {param_group}", progress_callback):
+            _save_param_ensemble_array_to_disk(
+                target_ensemble, param_ensemble_array, param_group, iens_active_index
+            )
 
+    with phase_timer("copy_unupdated_parameters", progress_callback):
         _copy_unupdated_parameters(
             list(source_ensemble.experiment.parameter_configuration.keys()),
             parameters,
@@ -665,6 +722,7 @@ def analysis_IES(
     # Then the result is [0,1,1,1]
     # This is needed for the SIES library
     masking_of_initial_parameters = ens_mask[initial_mask]
+    dtype = np.float32 if analysis_config.float32 else np.float64
 
     progress_callback(AnalysisStatusEvent(msg="Loading observations and responses.."))
 
@@ -684,6 +742,7 @@ def analysis_IES(
         observations,
         auto_scale_observations,
         progress_callback,
+        dtype,
     )
 
     smoother_snapshot.update_step_snapshots = update_snapshot
@@ -705,15 +764,18 @@ def analysis_IES(
     if sies_smoother is None:
         # The sies smoother must be initialized with the full parameter ensemble
         # Get relevant active realizations
-        parameter_ensemble_active = _all_parameters(source_ensemble, iens_active_index)
-        sies_smoother = ies.SIES(
-            parameters=parameter_ensemble_active,
-            covariance=observation_errors**2,
-            observations=observation_values,
-            seed=rng,
-            inversion=analysis_config.inversion,
-            truncation=analysis_config.enkf_truncation,
-        )
+        with phase_timer("initialize_smoother", progress_callback):
+            parameter_ensemble_active = _all_parameters(
+                source_ensemble, iens_active_index
+            )
+            sies_smoother = ies.SIES(
+                parameters=parameter_ensemble_active,
+                covariance=observation_errors**2,
+                observations=observation_values,
+                seed=rng,
+                inversion=analysis_config.inversion,
+                truncation=analysis_config.enkf_truncation,
+            )
 
         # Keep track of iterations to calculate step-lengths
         sies_smoother.iteration = 1
@@ -721,34 +783,42 @@ def analysis_IES(
     # Calculate step-lengths to scale SIES iteration
     step_length = sies_step_length(sies_smoother.iteration)
 
-    # Propose a transition matrix using only active realizations
-    proposed_W = sies_smoother.propose_W_masked(
-        S, ensemble_mask=masking_of_initial_parameters, step_length=step_length
-    )
+    with phase_timer("transition_matrix", progress_callback):
+        # Propose a transition matrix using only active realizations
+        proposed_W = sies_smoother.propose_W_masked(
+            S, ensemble_mask=masking_of_initial_parameters, step_length=step_length
+        )
 
-    # Store transition matrix for later use on sies object
-    sies_smoother.W[:, masking_of_initial_parameters] = proposed_W
+        # Store transition matrix for later use on sies object
+        sies_smoother.W[:, masking_of_initial_parameters] = proposed_W
+
+        # X_posterior = X_prior + X_prior @ W / sqrt(N - 1) = X_prior @ T
+        T = sies_smoother.W / np.sqrt(len(iens_active_index) - 1)
+        np.fill_diagonal(T, T.diagonal() + 1)
+        T = T.astype(dtype, copy=False)
 
     for param_group in parameters:
-        param_ensemble_array = _load_param_ensemble_array(
-            source_ensemble, param_group, iens_active_index
-        )
-        param_ensemble_array += (
-            param_ensemble_array @ sies_smoother.W / np.sqrt(len(iens_active_index) - 1)
-        )
+        with phase_timer(f"load_parameters: {param_group}", progress_callback):
+            param_ensemble_array = _load_param_ensemble_array(
+                source_ensemble, param_group, iens_active_index
+            )
+        with phase_timer(f"matmul: {param_group}", progress_callback):
+            _apply_transition_in_place(param_ensemble_array, T)
 
         progress_callback(AnalysisStatusEvent(msg=f"Storing data for {param_group}.."))
-        _save_param_ensemble_array_to_disk(
-            target_ensemble, param_ensemble_array, param_group, iens_active_index
-        )
+        with phase_timer(f"store_parameters: {param_group}", progress_callback):
+            _save_param_ensemble_array_to_disk(
+                target_ensemble, param_ensemble_array, param_group, iens_active_index
+            )
 
-    _copy_unupdated_parameters(
-        list(source_ensemble.experiment.parameter_configuration.keys()),
-        parameters,
-        iens_active_index,
-        source_ensemble,
-        target_ensemble,
-    )
+    with phase_timer("copy_unupdated_parameters", progress_callback):
+        _copy_unupdated_parameters(
+            list(source_ensemble.experiment.parameter_configuration.keys()),
+            parameters,
+            iens_active_index,
+            source_ensemble,
+            target_ensemble,
+        )
 
     assert sies_smoother is not None, "sies_smoother should be initialized"
 
@@ -775,6 +845,40 @@ def _create_smoother_snapshot(
     )
 
 
+def _record_timings(
+    smoother_snapshot: SmootherSnapshot,
+    progress_callback: Callable[[AnalysisEvent], None],
+) -> Callable[[AnalysisEvent], None]:
+    """Wrap progress_callback so that timings of the update phases are
+    also stored in the smoother snapshot"""
+
+    def callback(event: AnalysisEvent) -> None:
+        if isinstance(event, AnalysisTimingEvent):
+            smoother_snapshot.phase_timings.append(
+                PhaseTiming(
+                    phase=event.phase,
+                    wall=event.wall,
+                    cpu=event.cpu,
+                    peak_rss=event.peak_rss,
+                    bytes_read=event.bytes_read,
+                    bytes_written=event.bytes_written,
+                )
+            )
+        progress_callback(event)
+
+    return callback
+
+
+def _timings_event(smoother_snapshot: SmootherSnapshot) -> AnalysisDataEvent:
+    return AnalysisDataEvent(
+        name="Update timings",
+        data=DataSection(
+            header=smoother_snapshot.timings_header,
+            data=smoother_snapshot.timings_csv,
+        ),
+    )
+
+
 def smoother_update(
     prior_storage: Ensemble,
     posterior_storage: Ensemble,
@@ -800,6 +904,7 @@ def smoother_update(
         analysis_config,
         global_scaling,
     )
+    progress_callback = _record_timings(smoother_snapshot, progress_callback)
 
     try:
         analysis_ES(
@@ -818,6 +923,7 @@ def smoother_update(
             analysis_config.auto_scale_observations,
         )
     except Exception as e:
+        progress_callback(_timings_event(smoother_snapshot))
         progress_callback(
             AnalysisErrorEvent(
                 error_msg=str(e),
@@ -829,6 +935,7 @@ def smoother_update(
             )
         )
         raise e
+    progress_callback(_timings_event(smoother_snapshot))
     progress_callback(
         AnalysisCompleteEvent(
             data=DataSection(
@@ -868,6 +975,7 @@ def iterative_smoother_update(
         update_settings,
         global_scaling,
     )
+    progress_callback = _record_timings(smoother_snapshot, progress_callback)
 
     try:
         sies_smoother = analysis_IES(
@@ -888,6 +996,7 @@ def iterative_smoother_update(
             initial_mask=initial_mask,
         )
     except Exception as e:
+        progress_callback(_timings_event(smoother_snapshot))
         progress_callback(
             AnalysisErrorEvent(
                 error_msg=str(e),
@@ -899,6 +1008,7 @@ def iterative_smoother_update(
             )
         )
         raise e
+    progress_callback(_timings_event(smoother_snapshot))
     progress_callback(
         AnalysisCompleteEvent(
             data=DataSection(
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Tuple
+
+import psutil
+
+from .event import AnalysisEvent, AnalysisTimingEvent
+
+logger = logging.getLogger(__name__)
+
+MEMORY_SAMPLE_PERIOD = 0.05
+
+
+class _MemorySampler(threading.Thread):
+    """Samples the resident set size of the process in the background
+    and keeps track of the highest value seen"""
+
+    def __init__(self, process: psutil.Process, period: float) -> None:
+        super().__init__(daemon=True)
+        self._process = process
+        self._period = period
+        self._stopped = threading.Event()
+        self.peak_rss = process.memory_info().rss
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._period):
+            self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+    def stop(self) -> int:
+        self._stopped.set()
+        self.join()
+        self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+        return self.peak_rss
+
+
+def _io_counters(process: psutil.Process) -> Tuple[int, int]:
+    # io_counters is not available on all platforms, e.g. macOS
+    if not hasattr(process, "io_counters"):
+        return 0, 0
+    try:
+        counters = process.io_counters()
+    except (psutil.AccessDenied, NotImplementedError):
+        return 0, 0
+    return counters.read_bytes, counters.write_bytes
+
+
+@contextmanager
+def phase_timer(
+    phase: str,
+    progress_callback: Callable[[AnalysisEvent], None],
+    sample_period: float = MEMORY_SAMPLE_PERIOD,
+) -> Iterator[None]:
+    """Measure wall time, cpu time, peak resident memory and bytes read
+    and written for the enclosed phase of the update, and report it with an
+    AnalysisTimingEvent when the phase completes."""
+    process = psutil.Process()
+    sampler = _MemorySampler(process, sample_period)
+    read_start, written_start = _io_counters(process)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    sampler.start()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        peak_rss = sampler.stop()
+        read_end, written_end = _io_counters(process)
+        logger.info(f"Update phase {phase} completed in {wall:.3f} seconds")
+        progress_callback(
+            AnalysisTimingEvent(
+                phase=phase,
+                wall=wall,
+                cpu=cpu,
+                peak_rss=peak_rss,
+                bytes_read=read_end - read_start,
+                bytes_written=written_end - written_start,
+            )
+        )
@@ -25,6 +25,16 @@ class AnalysisTimeEvent(AnalysisEvent):
     elapsed_time: float
 
 
+@dataclass
+class AnalysisTimingEvent(AnalysisEvent):
+    phase: str
+    wall: float
+    cpu: float
+    peak_rss: int
+    bytes_read: int
+    bytes_written: int
+
+
 @dataclass
 class AnalysisReportEvent(AnalysisEvent):
     report: str
@@ -4,10 +4,16 @@
 import numpy as np
 import numpy.typing as npt
 from scipy.cluster.hierarchy import fcluster, linkage
-from scipy.stats import spearmanr
+from scipy.cluster.vq import kmeans2
+from scipy.stats import rankdata, spearmanr
 
 logger = logging.getLogger(__name__)
 
+# Hierarchical clustering needs all pairwise distances between observations,
+# which grows quadratically in memory. Groups larger than this are clustered
+# with k-means instead, see cluster_responses.
+MAX_HIERARCHICAL_CLUSTER_SIZE = 5000
+
 
 def get_scaling_factor(nr_observations: int, nr_components: int) -> float:
     """
@@ -45,7 +51,9 @@ def get_nr_primary_components(
     variance less than a specified threshold using Singular Value Decomposition (SVD).
     """
     data_matrix = responses - responses.mean(axis=0)
-    _, singulars, _ = np.linalg.svd(data_matrix.astype(float), full_matrices=False)
+    # Only the singular values are needed, so skip computing the (potentially
+    # very large) singular vectors.
+    singulars = np.linalg.svd(data_matrix.astype(float), compute_uv=False)
     # Calculate cumulative variance ratio:
     # Squared singular values are proportional to variance explained by each principal component.
     # We compute the cumulative sum of these, then divide by their total sum to get the
@@ -54,19 +62,55 @@ def get_nr_primary_components(
     return len([1 for i in variance_ratio[:-1] if i < threshold])
 
 
+def correlation_features(responses: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Compute features for each response (column) such that the euclidean
+    distance between the features of two responses equals the euclidean
+    distance between their rows in the Spearman correlation matrix.
+
+    With Z the column-wise standardized ranks of the responses, the
+    correlation matrix is C = Z^T Z. Writing Z = U S V^T, the distance between
+    rows i and j of C is ||S U^T (z_i - z_j)||, so the rows of V S^2 can be used
+    as features without ever forming the (n_responses x n_responses) matrix C.
+    """
+    ranks = rankdata(responses, axis=0)
+    ranks -= ranks.mean(axis=0)
+    norms = np.linalg.norm(ranks, axis=0)
+    # Constant responses have no correlation with anything
+    ranks = np.divide(ranks, norms, out=np.zeros_like(ranks), where=norms > 0)
+    _, singulars, vt = np.linalg.svd(ranks, full_matrices=False)
+    return vt.T * singulars**2
+
+
 def cluster_responses(
     responses: npt.NDArray[np.float64],
     nr_clusters: int,
+    max_hierarchical_size: int = MAX_HIERARCHICAL_CLUSTER_SIZE,
 ) -> npt.NDArray[np.int_]:
     """
     Cluster responses using hierarchical clustering based on Spearman correlation.
     Observations that tend to vary similarly across different simulation runs will be clustered together.
+
+    Groups with more than max_hierarchical_size responses are clustered with
+    k-means on features with the same pairwise distances as the rows of the
+    correlation matrix, see correlation_features, as hierarchical clustering
+    scales quadratically in memory with the number of responses.
     """
-    correlation = spearmanr(responses).statistic
-    if isinstance(correlation, np.float64):
-        correlation = np.array([[1, correlation], [correlation, 1]])
-    linkage_matrix = linkage(correlation, "average", "euclidean")
-    return fcluster(linkage_matrix, nr_clusters, criterion="maxclust", depth=2)
+    if responses.shape[1] <= max_hierarchical_size:
+        correlation = spearmanr(responses).statistic
+        if isinstance(correlation, np.float64):
+            correlation = np.array([[1, correlation], [correlation, 1]])
+        linkage_matrix = linkage(correlation, "average", "euclidean")
+        return fcluster(linkage_matrix, nr_clusters, criterion="maxclust", depth=2)
+    logger.info(
+        f"Using k-means clustering for {responses.shape[1]} responses "
+        f"as it is above the limit of {max_hierarchical_size} "
+        "for hierarchical clustering"
+    )
+    features = correlation_features(responses)
+    _, labels = kmeans2(features, max(nr_clusters, 1), minit="++", seed=1234)
+    # Number the clusters from 1, as fcluster does
+    return labels + 1
 
 
 def main(
@@ -113,6 +157,8 @@ def main(
         which can be advantageous in some scenarios.
         One potential issue is that data can have a certain number of significant dimension but
         a different number of natural clusters.
+        For large groups k-means is used in place of hierarchical clustering, see
+        cluster_responses.
     4. Cluster-Based PCA and Scaling:
         For each cluster, PCA is performed to determine the number of principal components that
         explain a specified percentage of variance within that cluster.
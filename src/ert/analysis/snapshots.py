@@ -43,6 +43,15 @@ def get_status(self) -> str:
         return "Active"
 
 
+class PhaseTiming(BaseModel):
+    phase: str
+    wall: float
+    cpu: float
+    peak_rss: int
+    bytes_read: int
+    bytes_written: int
+
+
 class SmootherSnapshot(BaseModel):
     source_ensemble_name: str
     target_ensemble_name: str
@@ -50,6 +59,7 @@ class SmootherSnapshot(BaseModel):
     std_cutoff: float
     global_scaling: float
     update_step_snapshots: List[ObservationAndResponseSnapshot]
+    phase_timings: List[PhaseTiming] = []
 
     @property
     def header(self) -> List[str]:
@@ -116,4 +126,35 @@ def extra(self) -> Dict[str, str]:
                     for val in self.update_step_snapshots
                 )
             ),
+            "Peak memory (MB)": f"{self.peak_rss / 1e6:.1f}",
         }
+
+    @property
+    def peak_rss(self) -> int:
+        """The highest resident memory of the process seen during the update"""
+        return max((timing.peak_rss for timing in self.phase_timings), default=0)
+
+    @property
+    def timings_header(self) -> List[str]:
+        return [
+            "Phase",
+            "Wall time (s)",
+            "CPU time (s)",
+            "Peak RSS (MB)",
+            "Read (MB)",
+            "Written (MB)",
+        ]
+
+    @property
+    def timings_csv(self) -> List[List[Any]]:
+        return [
+            [
+                timing.phase,
+                timing.wall,
+                timing.cpu,
+                timing.peak_rss / 1e6,
+                timing.bytes_read / 1e6,
+                timing.bytes_written / 1e6,
+            ]
+            for timing in self.phase_timings
+        ]
@@ -22,6 +22,13 @@ class BaseSettings(BaseModel):
         float,
         Field(gt=0.0, le=1.0, title="Singular value truncation"),
     ] = DEFAULT_ENKF_TRUNCATION
+    float32: Annotated[
+        bool,
+        Field(
+            title="Single precision update",
+            description="Compute the update with 32-bit floats to reduce memory usage",
+        ),
+    ] = False
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
 
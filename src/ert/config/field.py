@@ -187,7 +187,7 @@ def save_parameters(
         data: npt.NDArray[np.float64],
     ) -> None:
         ma = np.ma.MaskedArray(  # type: ignore
-            data=np.zeros(self.mask.size),
+            data=np.zeros(self.mask.size, dtype=np.float32),
             mask=self.mask,
             fill_value=np.nan,
         )
@@ -199,15 +199,21 @@ def save_parameters(
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
     ) -> npt.NDArray[np.float64]:
-        ds = ensemble.load_parameters(group, realizations)
-        ensemble_size = len(ds.realizations)
-        da = xr.DataArray(
-            [
-                np.ma.MaskedArray(data=d, mask=self.mask).compressed()  # type: ignore
-                for d in ds["values"].values.reshape(ensemble_size, -1)
-            ]
-        )
-        return da.T.to_numpy()
+        # Realizations are read one at the time straight into the output
+        # array, so that at most one extra realization is held in memory
+        active = ~np.ravel(self.mask)
+        parameters: Optional[npt.NDArray[np.float64]] = None
+        for i, realization in enumerate(realizations):
+            values = ensemble.load_parameters(group, int(realization))["values"]
+            if parameters is None:
+                parameters = np.empty(
+                    (np.count_nonzero(active), len(realizations)),
+                    dtype=values.dtype,
+                    order="F",
+                )
+            parameters[:, i] = values.values.ravel()[active]
+        assert parameters is not None
+        return parameters
 
     def _fetch_from_ensemble(self, real_nr: int, ensemble: Ensemble) -> xr.DataArray:
         da = ensemble.load_parameters(self.name, real_nr)["values"]
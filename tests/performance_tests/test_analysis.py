@@ -0,0 +1,386 @@
+import datetime
+import tracemalloc
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+import iterative_ensemble_smoother as ies
+import numpy as np
+import pytest
+import xarray as xr
+import xtgeo
+from iterative_ensemble_smoother import steplength_exponential
+
+from ert.analysis import iterative_smoother_update, smoother_update
+from ert.analysis._es_update import (
+    _load_observations_and_responses,
+    _load_param_ensemble_array,
+    _save_param_ensemble_array_to_disk,
+)
+from ert.analysis.misfit_preprocessor import main as auto_scale
+from ert.config import (
+    Field,
+    GenDataConfig,
+    GenKwConfig,
+    SummaryConfig,
+    SurfaceConfig,
+)
+from ert.config.analysis_config import UpdateSettings
+from ert.config.analysis_module import ESSettings, IESSettings
+from ert.config.gen_kw_config import TransformFunctionDefinition
+from ert.field_utils import Shape
+from ert.storage import open_storage
+
+
+@dataclass
+class ProblemSize:
+    field_shape: Shape
+    surface_shape: Shape
+    num_gen_kw: int
+    num_gen_data: int
+    num_summary_keys: int
+    num_summary_times: int
+    num_realizations: int
+
+    @property
+    def num_observations(self) -> int:
+        return self.num_gen_data + self.num_summary_keys * self.num_summary_times
+
+    @property
+    def num_parameters(self) -> int:
+        field = self.field_shape.nx * self.field_shape.ny * self.field_shape.nz
+        surface = self.surface_shape.nx * self.surface_shape.ny
+        return self.num_gen_kw + field + surface
+
+    def __str__(self) -> str:
+        return (
+            f"params: {self.num_parameters}, "
+            f"obs: {self.num_observations}, "
+            f"reals: {self.num_realizations}"
+        )
+
+
+sizes = [
+    pytest.param(
+        ProblemSize(Shape(10, 10, 5), Shape(10, 10, 1), 10, 100, 2, 50, 20),
+        marks=pytest.mark.quick_only,
+    ),
+    pytest.param(
+        ProblemSize(Shape(50, 50, 20), Shape(100, 100, 1), 50, 2000, 10, 300, 100),
+        marks=pytest.mark.slow,
+    ),
+    pytest.param(
+        ProblemSize(Shape(100, 100, 10), Shape(200, 200, 1), 100, 5000, 10, 300, 200),
+        marks=pytest.mark.slow,
+    ),
+]
+
+
+def peak_memory(func: Callable[[], Any], extra_info: Dict[str, Any]) -> Any:
+    """Run func once while tracing allocations, and record the
+    peak memory in bytes in the benchmark extra info"""
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    extra_info["peak_memory"] = peak
+    return result
+
+
+def run_phase(benchmark, func: Callable[[], Any]) -> Any:
+    peak_memory(func, benchmark.extra_info)
+    return benchmark.pedantic(func, rounds=3, iterations=1)
+
+
+@pytest.fixture(params=sizes, ids=str)
+def problem(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    size: ProblemSize = request.param
+    rng = np.random.default_rng(1234)
+    reals = size.num_realizations
+
+    field_shape = size.field_shape
+    grid = xtgeo.create_box_grid(
+        dimension=(field_shape.nx, field_shape.ny, field_shape.nz)
+    )
+    grid.to_file("GRID.EGRID", "egrid")
+    field = Field.from_config_list(
+        "GRID.EGRID",
+        field_shape,
+        ["FIELD", "FIELD", "field.grdecl", "INIT_FILES:field_%d.grdecl"],
+    )
+    surface_shape = size.surface_shape
+    surface = SurfaceConfig(
+        name="SURFACE",
+        forward_init=False,
+        update=True,
+        ncol=surface_shape.nx,
+        nrow=surface_shape.ny,
+        xori=0.0,
+        yori=0.0,
+        xinc=1.0,
+        yinc=1.0,
+        rotation=0.0,
+        yflip=1,
+        forward_init_file="surface_%d.irap",
+        output_file="surface.irap",
+        base_surface_path="base_surface.irap",
+    )
+    gen_kw = GenKwConfig(
+        name="GEN_KW",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition(f"KEY{i}", "NORMAL", [0, 1])
+            for i in range(size.num_gen_kw)
+        ],
+        output_file="kw.txt",
+        update=True,
+    )
+
+    summary_keys = [f"KEY{i}" for i in range(size.num_summary_keys)]
+    start = datetime.datetime(2010, 1, 1)
+    times = [start + datetime.timedelta(days=i) for i in range(size.num_summary_times)]
+    gen_data = GenDataConfig(name="GEN_DATA")
+    summary = SummaryConfig(name="summary", input_file="CASE", keys=summary_keys)
+
+    observations = {
+        "GEN_DATA_OBS": xr.Dataset(
+            {
+                "observations": (
+                    ["report_step", "index"],
+                    rng.standard_normal((1, size.num_gen_data)),
+                ),
+                "std": (["report_step", "index"], np.ones((1, size.num_gen_data))),
+            },
+            coords={"index": np.arange(size.num_gen_data), "report_step": [0]},
+            attrs={"response": "GEN_DATA"},
+        )
+    }
+    for key in summary_keys:
+        observations[f"{key}_OBS"] = xr.Dataset(
+            {
+                "observations": (
+                    ["name", "time"],
+                    rng.standard_normal((1, size.num_summary_times)),
+                ),
+                "std": (["name", "time"], np.ones((1, size.num_summary_times))),
+            },
+            coords={"time": times, "name": [key]},
+            attrs={"response": "summary"},
+        )
+
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        experiment = storage.create_experiment(
+            parameters=[gen_kw, field, surface],
+            responses=[gen_data, summary],
+            observations=observations,
+        )
+        prior = storage.create_ensemble(
+            experiment, ensemble_size=reals, iteration=0, name="prior"
+        )
+        for iens in range(reals):
+            gen_kw.save_parameters(
+                prior, "GEN_KW", iens, rng.standard_normal(size.num_gen_kw)
+            )
+            field.save_parameters(prior, "FIELD", iens, rng.standard_normal(len(field)))
+            surface.save_parameters(
+                prior, "SURFACE", iens, rng.standard_normal(len(surface))
+            )
+            prior.save_response(
+                "GEN_DATA",
+                xr.Dataset(
+                    {
+                        "values": (
+                            ["report_step", "index"],
+                            rng.standard_normal((1, size.num_gen_data)),
+                        )
+                    },
+                    coords={"index": np.arange(size.num_gen_data), "report_step": [0]},
+                ),
+                iens,
+            )
+            prior.save_response(
+                "summary",
+                xr.Dataset(
+                    {
+                        "values": (
+                            ["name", "time"],
+                            rng.standard_normal(
+                                (size.num_summary_keys, size.num_summary_times)
+                            ),
+                        )
+                    },
+                    coords={"time": times, "name": summary_keys},
+                ),
+                iens,
+            )
+        posterior = storage.create_ensemble(
+            experiment,
+            ensemble_size=reals,
+            iteration=1,
+            name="posterior",
+            prior_ensemble=prior,
+        )
+        yield prior, posterior, size
+
+
+PARAMETERS = ["GEN_KW", "FIELD", "SURFACE"]
+
+
+def observation_keys(ensemble) -> List[str]:
+    return list(ensemble.experiment.observations.keys())
+
+
+def active_realizations(ensemble):
+    return np.flatnonzero(ensemble.get_realization_mask_with_responses())
+
+
+@pytest.mark.parametrize("group", PARAMETERS)
+def test_benchmark_parameter_loading(benchmark, problem, group):
+    prior, _, _ = problem
+    iens_active_index = active_realizations(prior)
+    run_phase(
+        benchmark,
+        partial(_load_param_ensemble_array, prior, group, iens_active_index),
+    )
+
+
+def test_benchmark_response_loading(benchmark, problem):
+    prior, _, _ = problem
+    iens_active_index = tuple(active_realizations(prior))
+
+    def load_responses():
+        for group in ["GEN_DATA", "summary"]:
+            prior.load_responses(group, iens_active_index)
+        prior.load_responses.cache_clear()
+
+    run_phase(benchmark, load_responses)
+
+
+@pytest.mark.parametrize(
+    "auto_scale_observations", [None, [["*"]]], ids=["", "auto_scale"]
+)
+def test_benchmark_alignment(benchmark, problem, auto_scale_observations):
+    prior, _, size = problem
+    S, *_ = run_phase(
+        benchmark,
+        partial(
+            _load_observations_and_responses,
+            prior,
+            alpha=np.inf,
+            std_cutoff=0.0,
+            global_std_scaling=1.0,
+            iens_active_index=active_realizations(prior),
+            selected_observations=observation_keys(prior),
+            auto_scale_observations=auto_scale_observations,
+            progress_callback=lambda _: None,
+        ),
+    )
+    assert S.shape == (size.num_observations, size.num_realizations)
+
+
+def test_benchmark_auto_scaling(benchmark, problem):
+    _, _, size = problem
+    rng = np.random.default_rng(1234)
+    responses = rng.standard_normal((size.num_observations, size.num_realizations))
+    run_phase(
+        benchmark,
+        partial(auto_scale, responses, np.ones(size.num_observations)),
+    )
+
+
+def test_benchmark_transition_matrix(benchmark, problem):
+    _, _, size = problem
+    rng = np.random.default_rng(1234)
+    responses = rng.standard_normal((size.num_observations, size.num_realizations))
+    smoother = ies.ESMDA(
+        covariance=np.ones(size.num_observations),
+        observations=np.zeros(size.num_observations),
+        alpha=1,
+        seed=rng,
+    )
+    run_phase(
+        benchmark,
+        partial(
+            smoother.compute_transition_matrix, Y=responses, alpha=1.0, truncation=0.98
+        ),
+    )
+
+
+def test_benchmark_matmul(benchmark, problem):
+    prior, _, size = problem
+    rng = np.random.default_rng(1234)
+    parameters = _load_param_ensemble_array(prior, "FIELD", active_realizations(prior))
+    T = rng.standard_normal((size.num_realizations, size.num_realizations))
+    run_phase(benchmark, lambda: parameters @ T.astype(parameters.dtype))
+
+
+@pytest.mark.parametrize("group", PARAMETERS)
+def test_benchmark_write_back(benchmark, problem, group):
+    prior, posterior, _ = problem
+    iens_active_index = active_realizations(prior)
+    parameters = _load_param_ensemble_array(prior, group, iens_active_index)
+    run_phase(
+        benchmark,
+        partial(
+            _save_param_ensemble_array_to_disk,
+            posterior,
+            parameters,
+            group,
+            iens_active_index,
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "es_settings, update_settings",
+    [
+        (ESSettings(), UpdateSettings()),
+        (ESSettings(localization=True), UpdateSettings()),
+        (ESSettings(), UpdateSettings(auto_scale_observations=[["*"]])),
+    ],
+    ids=["", "localization", "auto_scale"],
+)
+def test_benchmark_smoother_update(benchmark, problem, es_settings, update_settings):
+    prior, posterior, _ = problem
+    run_phase(
+        benchmark,
+        partial(
+            smoother_update,
+            prior,
+            posterior,
+            observation_keys(prior),
+            PARAMETERS,
+            update_settings,
+            es_settings,
+            rng=np.random.default_rng(1234),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "update_settings",
+    [UpdateSettings(), UpdateSettings(auto_scale_observations=[["*"]])],
+    ids=["", "auto_scale"],
+)
+def test_benchmark_iterative_smoother_update(benchmark, problem, update_settings):
+    prior, posterior, size = problem
+
+    def update():
+        iterative_smoother_update(
+            prior,
+            posterior,
+            None,
+            PARAMETERS,
+            observation_keys(prior),
+            update_settings,
+            IESSettings(),
+            sies_step_length=steplength_exponential,
+            initial_mask=np.ones(size.num_realizations, dtype=bool),
+            rng=np.random.default_rng(1234),
+        )
+
+    run_phase(benchmark, update)
@@ -6,10 +6,13 @@
 import py
 import pytest
 import xarray as xr
+import xtgeo
 
 from ert.analysis import smoother_update
-from ert.config import ErtConfig
+from ert.config import ErtConfig, ESSettings, Field, GenDataConfig
+from ert.config.analysis_config import UpdateSettings
 from ert.enkf_main import sample_prior
+from ert.field_utils import Shape
 from ert.storage import open_storage
 from tests.performance_tests.performance_utils import make_poly_example
 
@@ -61,6 +64,89 @@ def test_memory_smoothing(poly_template):
         )
 
 
+@pytest.fixture
+def field_storage(tmp_path, monkeypatch):
+    """Storage with a single FIELD parameter of 1e6 float32 cells for 40
+    realizations, i.e. 160 MB of parameters in total"""
+    monkeypatch.chdir(tmp_path)
+    shape = Shape(100, 100, 100)
+    num_realizations = 40
+    num_observations = 2000
+    rng = np.random.default_rng(1234)
+    grid = xtgeo.create_box_grid(dimension=(shape.nx, shape.ny, shape.nz))
+    grid.to_file("GRID.EGRID", "egrid")
+    field = Field.from_config_list(
+        "GRID.EGRID",
+        shape,
+        ["FIELD", "FIELD", "field.grdecl", "INIT_FILES:field_%d.grdecl"],
+    )
+    observations = xr.Dataset(
+        {
+            "observations": (
+                ["report_step", "index"],
+                rng.standard_normal((1, num_observations)),
+            ),
+            "std": (["report_step", "index"], np.ones((1, num_observations))),
+        },
+        coords={"index": np.arange(num_observations), "report_step": [0]},
+        attrs={"response": "RESPONSE"},
+    )
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        experiment = storage.create_experiment(
+            parameters=[field],
+            responses=[GenDataConfig(name="RESPONSE")],
+            observations={"OBSERVATION": observations},
+        )
+        prior = storage.create_ensemble(
+            experiment, ensemble_size=num_realizations, iteration=0, name="prior"
+        )
+        for iens in range(num_realizations):
+            field.save_parameters(
+                prior,
+                "FIELD",
+                iens,
+                rng.standard_normal(len(field), dtype=np.float32),
+            )
+            prior.save_response(
+                "RESPONSE",
+                xr.Dataset(
+                    {
+                        "values": (
+                            ["report_step", "index"],
+                            rng.standard_normal((1, num_observations)),
+                        )
+                    },
+                    coords={"index": np.arange(num_observations), "report_step": [0]},
+                ),
+                iens,
+            )
+        posterior = storage.create_ensemble(
+            experiment,
+            ensemble_size=num_realizations,
+            iteration=1,
+            name="posterior",
+            prior_ensemble=prior,
+        )
+        yield prior, posterior
+
+
+@pytest.mark.limit_memory("300 MB")
+@pytest.mark.integration_test
+def test_memory_smoothing_of_field_in_float32(field_storage):
+    """The parameters of the field take 160 MB, and the update should
+    not need much more than one copy of them"""
+    prior, posterior = field_storage
+    smoother_snapshot = smoother_update(
+        prior,
+        posterior,
+        ["OBSERVATION"],
+        ["FIELD"],
+        UpdateSettings(alpha=np.inf),
+        ESSettings(float32=True),
+    )
+    assert smoother_snapshot.peak_rss > 0
+
+
 def fill_storage_with_data(poly_template: Path, ert_config: ErtConfig) -> None:
     path = Path(poly_template) / "ensembles"
     with open_storage(path, mode="w") as storage:
@@ -20,10 +20,17 @@
     smoother_update,
 )
 from ert.analysis._es_update import (
+    _apply_transition_in_place,
+    _compress_rows_in_place,
     _load_param_ensemble_array,
     _save_param_ensemble_array_to_disk,
 )
-from ert.analysis.event import AnalysisCompleteEvent, AnalysisErrorEvent
+from ert.analysis.event import (
+    AnalysisCompleteEvent,
+    AnalysisDataEvent,
+    AnalysisErrorEvent,
+    AnalysisTimingEvent,
+)
 from ert.config import Field, GenDataConfig, GenKwConfig
 from ert.config.analysis_config import UpdateSettings
 from ert.config.analysis_module import ESSettings, IESSettings
@@ -108,6 +115,51 @@ def test_update_report(
     )
 
 
+def test_update_timings_are_reported(snake_oil_case_storage, snake_oil_storage):
+    ert_config = snake_oil_case_storage
+    prior_ens = snake_oil_storage.get_ensemble_by_name("default_0")
+    posterior_ens = snake_oil_storage.create_ensemble(
+        prior_ens.experiment_id,
+        ensemble_size=ert_config.model_config.num_realizations,
+        iteration=1,
+        name="new_ensemble",
+        prior_ensemble=prior_ens,
+    )
+    events = []
+
+    smoother_snapshot = smoother_update(
+        prior_ens,
+        posterior_ens,
+        list(ert_config.observations.keys()),
+        ["SNAKE_OIL_PARAM"],
+        UpdateSettings(auto_scale_observations=[["*"]]),
+        ESSettings(),
+        progress_callback=events.append,
+    )
+
+    timing_events = [e for e in events if isinstance(e, AnalysisTimingEvent)]
+    assert [e.phase for e in timing_events] == [
+        "load_observations_and_responses",
+        "auto_scale: *",
+        "transition_matrix",
+        "load_parameters: SNAKE_OIL_PARAM",
+        "matmul: SNAKE_OIL_PARAM",
+        "store_parameters: SNAKE_OIL_PARAM",
+        "copy_unupdated_parameters",
+    ]
+    assert all(e.wall >= 0 and e.cpu >= 0 and e.peak_rss > 0 for e in timing_events)
+    assert [t.phase for t in smoother_snapshot.phase_timings] == [
+        e.phase for e in timing_events
+    ]
+    timings_table = next(
+        e
+        for e in events
+        if isinstance(e, AnalysisDataEvent) and e.name == "Update timings"
+    )
+    assert timings_table.data.header == smoother_snapshot.timings_header
+    assert len(timings_table.data.data) == len(timing_events)
+
+
 def test_update_report_with_exception_in_analysis_ES(
     snapshot,
     snake_oil_case_storage,
@@ -321,6 +373,84 @@ def test_update_snapshot(
     assert target_gen_kw == pytest.approx(expected_gen_kw)
 
 
+@pytest.mark.parametrize("module", ["IES_ENKF", "STD_ENKF"])
+def test_that_float32_update_is_close_to_float64_update(
+    snake_oil_case_storage, snake_oil_storage, module
+):
+    ert_config = snake_oil_case_storage
+    prior_ens = snake_oil_storage.get_ensemble_by_name("default_0")
+    posterior = {}
+    for float32 in [False, True]:
+        posterior_ens = snake_oil_storage.create_ensemble(
+            prior_ens.experiment_id,
+            ensemble_size=ert_config.model_config.num_realizations,
+            iteration=1,
+            name=f"posterior_{float32}",
+            prior_ensemble=prior_ens,
+        )
+        if module == "IES_ENKF":
+            iterative_smoother_update(
+                prior_storage=prior_ens,
+                posterior_storage=posterior_ens,
+                sies_smoother=None,
+                observations=list(ert_config.observations.keys()),
+                parameters=list(ert_config.ensemble_config.parameters),
+                update_settings=UpdateSettings(),
+                analysis_config=IESSettings(float32=float32),
+                sies_step_length=steplength_exponential,
+                initial_mask=prior_ens.get_realization_mask_with_responses(),
+                rng=np.random.default_rng(42),
+            )
+        else:
+            smoother_update(
+                prior_ens,
+                posterior_ens,
+                list(ert_config.observations.keys()),
+                list(ert_config.ensemble_config.parameters),
+                UpdateSettings(),
+                ESSettings(float32=float32),
+                rng=np.random.default_rng(42),
+            )
+        posterior[float32] = posterior_ens.load_parameters(
+            "SNAKE_OIL_PARAM", range(ert_config.model_config.num_realizations)
+        )["values"].values
+
+    assert not np.array_equal(
+        prior_ens.load_parameters(
+            "SNAKE_OIL_PARAM", range(ert_config.model_config.num_realizations)
+        )["values"].values,
+        posterior[False],
+    )
+    np.testing.assert_allclose(posterior[True], posterior[False], rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.parametrize("nr_rows", [1, 7, 100])
+def test_that_compress_rows_in_place_equals_boolean_indexing(nr_rows):
+    rng = np.random.default_rng(1234)
+    for _ in range(20):
+        arr = rng.standard_normal((nr_rows, 5))
+        mask = rng.choice([True, False], nr_rows)
+        expected = arr[mask]
+        result = _compress_rows_in_place(arr, mask)
+        np.testing.assert_array_equal(result, expected)
+        assert result.size == 0 or np.shares_memory(result, arr)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 1000])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("fortran_order", [True, False])
+def test_that_apply_transition_in_place_equals_matmul(chunk_size, dtype, fortran_order):
+    rng = np.random.default_rng(1234)
+    X = rng.standard_normal((25, 8)).astype(dtype)
+    if fortran_order:
+        X = np.asfortranarray(X)
+    T = rng.standard_normal((8, 8))
+    expected = X @ T.astype(dtype)
+    _apply_transition_in_place(X, T, chunk_size=chunk_size)
+    assert X.dtype == dtype
+    np.testing.assert_allclose(X, expected, rtol=1e-5)
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.mark.parametrize(
     "alpha, expected, expectation",
@@ -1,8 +1,12 @@
 import numpy as np
 import pytest
+from scipy.spatial.distance import pdist
+from scipy.stats import spearmanr
 from sklearn.preprocessing import StandardScaler
 
 from ert.analysis.misfit_preprocessor import (
+    cluster_responses,
+    correlation_features,
     get_nr_primary_components,
     get_scaling_factor,
     main,
@@ -113,3 +117,39 @@ def test_misfit_preprocessor_single(nr_observations):
         result,
         np.array(nr_observations * [1.0]),
     )
+
+
+@pytest.mark.parametrize(
+    "nr_responses, nr_realizations", [(2, 10), (50, 20), (30, 200)]
+)
+def test_that_correlation_features_preserve_correlation_distances(
+    nr_responses, nr_realizations
+):
+    rng = np.random.default_rng(1234)
+    responses = rng.standard_normal((nr_realizations, nr_responses))
+    correlation = spearmanr(responses).statistic
+    if isinstance(correlation, np.float64):
+        correlation = np.array([[1, correlation], [correlation, 1]])
+    np.testing.assert_allclose(
+        pdist(correlation_features(responses)), pdist(correlation), atol=1e-10
+    )
+
+
+@pytest.mark.parametrize("max_hierarchical_size", [10000, 10])
+def test_that_cluster_responses_finds_correlated_groups(max_hierarchical_size):
+    """Three groups of responses driven by independent parameters should
+    end up in three clusters, using both hierarchical clustering and
+    the k-means fallback for large groups"""
+    rng = np.random.default_rng(1234)
+    nr_realizations = 100
+    group_size = 20
+    parameters = rng.standard_normal((nr_realizations, 3))
+    responses = np.repeat(parameters, group_size, axis=1) + 0.1 * rng.standard_normal(
+        (nr_realizations, 3 * group_size)
+    )
+    clusters = cluster_responses(
+        responses, nr_clusters=3, max_hierarchical_size=max_hierarchical_size
+    )
+    groups = clusters.reshape(3, group_size)
+    assert all(len(np.unique(group)) == 1 for group in groups)
+    assert len(np.unique(groups[:, 0])) == 3
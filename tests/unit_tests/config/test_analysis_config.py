@@ -140,6 +140,22 @@ def test_unknown_variable_raises_validation_error():
         )
 
 
+@pytest.mark.parametrize("module", ["STD_ENKF", "IES_ENKF"])
+def test_float32_is_set_from_analysis_set_var(module):
+    analysis_config = AnalysisConfig.from_dict(
+        {
+            ConfigKeys.ANALYSIS_SET_VAR: [[module, "FLOAT32", "True"]],
+        }
+    )
+    settings = (
+        analysis_config.es_module
+        if module == "STD_ENKF"
+        else analysis_config.ies_module
+    )
+    assert settings.float32
+    assert not AnalysisConfig.from_dict({}).es_module.float32
+
+
 def test_default_alpha_is_set():
     default_alpha = 3.0
     assert AnalysisConfig.from_dict({}).observation_settings.alpha == default_alpha